@@ -36,7 +36,7 @@ except ImportError:
 from timeit import default_timer as timer
 
 from optimize_images.file_utils import search_images
-from optimize_images.data_structures import Task
+from optimize_images.data_structures import Task, CliArgs
 from optimize_images.do_optimization import do_optimization
 from optimize_images.platforms import adjust_for_platform, IconGenerator
 from optimize_images.argument_parser import get_args
@@ -44,34 +44,37 @@ from optimize_images.reporting import show_file_status, show_final_report
 from optimize_images.reporting import show_img_exception
 
 
+def make_task(img_path: str, args: CliArgs) -> Task:
+    return Task(img_path, args.quality, args.remove_transparency,
+                args.reduce_colors, args.max_colors, args.max_w, args.max_h,
+                args.keep_exif, args.convert_all, args.conv_big,
+                args.force_del, args.bg_color, args.grayscale,
+                args.no_size_comparison, args.fast_mode)
+
+
 def main():
     appstart = timer()
     line_width, our_pool_executor, workers = adjust_for_platform()
 
-    (watch_dir, src_path, recursive, quality, remove_transparency,
-     reduce_colors, max_colors, max_w, max_h, keep_exif, convert_all, conv_big,
-     force_del, bg_color, grayscale, ignore_size_comparison, fast_mode, jobs) \
-        = get_args()
+    args = get_args()
+    src_path = args.src_path
 
-    if jobs != 0:
-        workers = jobs
+    if args.jobs != 0:
+        workers = args.jobs
 
     found_files = 0
     optimized_files = 0
     total_src_size = 0
     total_bytes_saved = 0
 
-    if watch_dir:
+    if args.watch_dir:
         if not os.path.isdir(os.path.abspath(src_path)):
             print("\nPlease secify a valid path to an existing folder.")
             exit(1)
 
         from optimize_images.watch import watch_for_new_files
 
-        watch_task = Task(src_path, quality, remove_transparency, reduce_colors,
-                          max_colors, max_w, max_h, keep_exif, convert_all,
-                          conv_big, force_del, bg_color, grayscale,
-                          ignore_size_comparison, fast_mode)
+        watch_task = make_task(src_path, args)
 
         watch_for_new_files(watch_task)
         exit()
@@ -79,15 +82,13 @@ def main():
     # Optimize all images in a directory
     elif os.path.isdir(src_path):
         icons = IconGenerator()
-        recursion_txt = 'Recursively searching' if recursive else 'Searching'
+        recursion_txt = 'Recursively searching' if args.recursive else 'Searching'
         opt_msg = 'and optimizing image files'
-        exif_txt = '(keeping exif data) ' if keep_exif else ''
+        exif_txt = '(keeping exif data) ' if args.keep_exif else ''
         print(f"\n{recursion_txt} {opt_msg} {exif_txt}in:\n{src_path}\n")
 
-        tasks = (Task(img_path, quality, remove_transparency, reduce_colors,
-                      max_colors, max_w, max_h, keep_exif, convert_all, conv_big,
-                      force_del, bg_color, grayscale, ignore_size_comparison, fast_mode)
-                 for img_path in search_images(src_path, recursive=recursive)
+        tasks = (make_task(img_path, args)
+                 for img_path in search_images(src_path, recursive=args.recursive)
                  if '~temp~' not in img_path)
 
         with our_pool_executor(max_workers=workers) as executor:
@@ -111,9 +112,7 @@ def main():
         icons = IconGenerator()
         found_files += 1
 
-        img_task = Task(src_path, quality, remove_transparency, reduce_colors,
-                        max_colors, max_w, max_h, keep_exif, convert_all, conv_big,
-                        force_del, bg_color, grayscale, ignore_size_comparison, fast_mode)
+        img_task = make_task(src_path, args)
 
         r = do_optimization(img_task)
         total_src_size = r.orig_size
@@ -0,0 +1,131 @@
+# encoding: utf-8
+
+# Help texts for the command-line interface. This module is only imported
+# when the help message is actually displayed (see LazyHelpArgumentParser in
+# cli_parser.py). Every argument and group must have an entry here.
+
+DESCRIPTION = (
+    'A command-line utility written in pure Python to reduce the file '
+    'size of images. You must explicitly pass it a path to the image '
+    'file or to the directory containing the image files to be '
+    'processed.')
+
+EPILOG = (
+    "PLEASE NOTE: The operation is done DESTRUCTIVELY, "
+    "by replacing the original files with the processed ones. You "
+    "definitely should duplicate the original file or folder before "
+    "using this utility, in order to be able to recover any damaged "
+    "images that don't have the desired quality. When doing format "
+    "conversion, if a JPEG with the same name already exists, it "
+    "be replaced by the JPEG file resulting from that conversion.")
+
+# Group descriptions, by group title
+GROUP_DESCRIPTIONS = {
+    'GENERAL IMAGE SETTINGS':
+        'These options will be applied individually to each '
+        'image being processed, independently of its format.',
+
+    'JPEG SPECIFIC OPTIONS':
+        'The following options apply only to JPEG image files.',
+
+    'PNG SPECIFIC OPTIONS':
+        'The following options apply only to PNG image files.',
+}
+
+# Argument help texts, by first option string (or destination, for
+# positional arguments)
+HELP_TEXTS = {
+    'path':
+        'The path to the image file or to the folder containing the '
+        'images to be optimized. By default, it will try to process '
+        'any images found in all of its subdirectories.',
+
+    '-s':
+        'Display the list of image formats currently supported.',
+
+    '-nr':
+        "Don't recurse through subdirectories.",
+
+    '-wd':
+        'Watch a directory continuously for new files and '
+        'optimize any file as soon as it is created (file '
+        'paths are saved in a temporary list, so that each '
+        'file should just be processed once per session).',
+
+    '-jobs':
+        'The max. number of simultaneous jobs to run at a given time. '
+        'The default value (0), for most platforms, will generate a '
+        'total of N + 1 processes, where N is the number of CPUs or '
+        'cores in the system.',
+
+    '-mw':
+        'The maximum width (in pixels).',
+
+    '-mh':
+        "The maximum height (in pixels). Any image that has a dimension "
+        "exceeding a specified value will be downsized as the first "
+        "optimization step. The resizing will not take effect if, "
+        "after the whole optimization process, the resulting file "
+        "size isn't any smaller than the original.",
+
+    '-g':
+        "Convert to grayscale.",
+
+    '-nc':
+        "Don't compare the original and resulting file sizes, and save "
+        "the new image anyway (useful, for instance, if you prefer to "
+        "have all images with the same color, size, or quality settings).",
+
+    '-fm':
+        'Skip some actions (e.g., the final palete rebuild for indexed '
+        'PNG images or variable JPEG quality setting) in order to '
+        'finish faster.',
+
+    '-q':
+        'Specify a fixed quality setting for JPEG files (an integer '
+        'value, between 1 and 100).',
+
+    '-ke':
+        "Keep image EXIF data (by default, it's discarded).",
+
+    '-rc':
+        "Reduce colors using an adaptive color palette. This option "
+        "can have a big impact both on file size and image quality.",
+
+    '-mc':
+        "The maximum number of colors when reducing colors (-rc) "
+        "(an integer between 0 and 255). Defaults to 255.",
+
+    '-rt':
+        "Remove transparency (by default, white background).",
+
+    '-bg':
+        "The background color to apply when removing transparency or "
+        "converting to JPEG. Specify 3 integer values (Red, Green and "
+        "Blue), between 0 and 255, separated by spaces. E.g.: "
+        "'255 0 0' for red).",
+
+    '-hbg':
+        "The background color in hexadecimal (HTML style) to use "
+        "when removing transparency or converting to JPEG. E.g.: '00FF00' "
+        "or '0F0' for green color.",
+
+    '-cb':
+        "Convert to JPEG any big PNG images that have "
+        "a large number of colors. It uses an algorithm "
+        "to determine whether it is a good idea and automatically decide "
+        "about it. By default, the original PNG "
+        "files will remain untouched and will be kept alongside the "
+        "optimized JPG images in their original folders (existing JPEGs "
+        "will be replaced).",
+
+    '-ca':
+        "Convert to JPEG all PNG images found. By default, "
+        "the original PNG "
+        "files will remain untouched and will be kept alongside the "
+        "optimized JPG images in their original folders (existing JPEGs "
+        "will be replaced).",
+
+    '-fd':
+        "Delete the original file when converting to JPG.",
+}
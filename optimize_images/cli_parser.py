@@ -0,0 +1,92 @@
+# encoding: utf-8
+
+# Argument parser class and type conversion functions for the command-line
+# arguments. This module is only imported when the argument parser is built
+# (see build_parser()), so argparse can be imported here without slowing down
+# trivial invocations.
+from argparse import ArgumentParser, ArgumentTypeError
+from string import hexdigits
+
+HEX_DIGITS = frozenset(hexdigits)
+
+
+class LazyHelpArgumentParser(ArgumentParser):
+    """ An ArgumentParser that only loads the (long) help texts from
+    cli_help.py when the help message is actually displayed.
+    """
+
+    def format_help(self):
+        self.load_help_texts()
+        return super().format_help()
+
+    def load_help_texts(self):
+        from optimize_images.cli_help import DESCRIPTION, EPILOG, \
+            GROUP_DESCRIPTIONS, HELP_TEXTS
+
+        self.description = DESCRIPTION
+        self.epilog = EPILOG
+        for group in self._action_groups:
+            if group in (self._positionals, self._optionals):
+                continue
+            if group.title not in GROUP_DESCRIPTIONS:
+                raise KeyError(f"No description for argument group "
+                               f"'{group.title}' in cli_help.py.")
+            group.description = GROUP_DESCRIPTIONS[group.title]
+        for action in self._actions:
+            if action.help is not None:
+                # Built-in help (-h, -v) or already loaded
+                continue
+            key = action.option_strings[0] if action.option_strings \
+                else action.dest
+            if key not in HELP_TEXTS:
+                raise KeyError(f"No help text for argument '{key}' in "
+                               f"cli_help.py.")
+            action.help = HELP_TEXTS[key]
+
+
+def int_in_range(value, lower, upper, msg):
+    """ Convert value to an integer between lower and upper (no upper limit
+    if upper is None), raising an ArgumentTypeError with msg otherwise.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise ArgumentTypeError(msg)
+    if number < lower or (upper is not None and number > upper):
+        raise ArgumentTypeError(msg)
+    return number
+
+
+def quality_type(value):
+    msg = "Please specify an integer quality value between 1 and 100."
+    return int_in_range(value, 1, 100, msg)
+
+
+def dimension_type(value):
+    msg = "Please specify image dimensions as positive integers."
+    return int_in_range(value, 0, None, msg)
+
+
+def color_component_type(value):
+    msg = "Background color should be entered as a sequence of 3 " \
+          "integer numbers between 0 and 255 (values for Red, Green and " \
+          "Blue components) separated by spaces. For instance, for a " \
+          "bright red you can use: '-bg 255 0 0' or '-hbg #FF0000'."
+    return int_in_range(value, 0, 255, msg)
+
+
+def hex_color_type(value):
+    """ Convert an hexadecimal color (e.g. "#FF0000", "FF0000" or the short
+    form "F00") to a tuple of integers (RGB).
+    """
+    hex_color = value[1:] if value.startswith('#') else value
+    if len(hex_color) not in (3, 6) or not HEX_DIGITS.issuperset(hex_color):
+        msg = "Hexadecimal background color was not entered in the correct " \
+              "format. Please follow these examples:\n\nWhite: FFFFFF" \
+              "\nBlack: 000000\nPure Red: FF0000"
+        raise ArgumentTypeError(msg)
+    if len(hex_color) == 3:
+        hex_color = ''.join(c * 2 for c in hex_color)
+    return (int(hex_color[0:2], 16),
+            int(hex_color[2:4], 16),
+            int(hex_color[4:6], 16))
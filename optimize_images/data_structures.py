@@ -15,6 +15,27 @@ PPoolExType = NewType('PPoolExType', concurrent.futures.ProcessPoolExecutor)
 TPoolExType = NewType('PPoolExType', concurrent.futures.ThreadPoolExecutor)
 
 
+class CliArgs(NamedTuple):
+    watch_dir: bool
+    src_path: str
+    recursive: bool
+    quality: int
+    remove_transparency: bool
+    reduce_colors: bool
+    max_colors: int
+    max_w: int
+    max_h: int
+    keep_exif: bool
+    convert_all: bool
+    conv_big: bool
+    force_del: bool
+    bg_color: Tuple[int, int, int]
+    grayscale: bool
+    no_size_comparison: bool
+    fast_mode: bool
+    jobs: int
+
+
 class Task(NamedTuple):
     src_path: str
     quality: int